@@ -1,17 +1,48 @@
 # type: ignore
 """
-This module defines various classes that can serve as the `input` to an interface. Each class must inherit from
-`InputComponent`, and each class must define a path to its template. All of the subclasses of `InputComponent` are
-automatically added to a registry, which allows them to be easily referenced in other parts of the code.
+This module defines deprecated classes that can serve as the `input` to an interface. Each class is a thin subclass
+of the corresponding component in `gradio.components` that maps the legacy arguments onto the new ones. These
+classes are not registered anywhere: string shortcuts such as "textbox" are resolved against `gradio.components`.
 """
 
 from __future__ import annotations
 
 import warnings
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from gradio import components
 
+_DEPRECATION_MESSAGE = "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components"
+# The warning is always attributed to this module, so the location is computed once here
+# instead of letting `warnings.warn` walk the stack on every call.
+_WARNING_FILENAME = __file__
+_WARNING_MODULE = __name__
+# One `warn_explicit` registry per shim class. The warnings module clears a registry whenever
+# the filters change, so a warning suppressed by an "ignore" filter is still shown to a
+# later instance once the filters allow it.
+_WARNING_REGISTRIES: Dict[type, dict] = {}
+
+
+def _warn_deprecated(cls: type, message: str = _DEPRECATION_MESSAGE) -> None:
+    """
+    Emits the deprecation warning for a given shim class. Under the default filters it is shown
+    once per class, like the per-location deduplication of `warnings.warn`, and repeated
+    instantiations return early from `warnings.warn_explicit` on a registry lookup.
+    """
+    registry = _WARNING_REGISTRIES.setdefault(cls, {})
+    warnings.warn_explicit(
+        message,
+        UserWarning,
+        _WARNING_FILENAME,
+        _WARNING_LINENO,
+        _WARNING_MODULE,
+        registry,
+    )
+
+
+# Point the warning at the helper's `def` line so it is printed with a real source line.
+_WARNING_LINENO = _warn_deprecated.__code__.co_firstlineno
+
 
 class Textbox(components.Textbox):
     def __init__(
@@ -24,10 +55,9 @@ class Textbox(components.Textbox):
         label: Optional[str] = None,
         optional: bool = False,
     ):
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Textbox.__init__(
+            self,
             value=default,
             lines=lines,
             placeholder=placeholder,
@@ -56,10 +86,8 @@ class Number(components.Number):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no value for this component.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(value=default, label=label, optional=optional)
+        _warn_deprecated(self.__class__)
+        components.Number.__init__(self, value=default, label=label, optional=optional)
 
 
 class Slider(components.Slider):
@@ -86,11 +114,9 @@ class Slider(components.Slider):
         label (str): component name in interface.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Slider.__init__(
+            self,
             value=default,
             minimum=minimum,
             maximum=maximum,
@@ -118,10 +144,10 @@ class Checkbox(components.Checkbox):
         default (bool): if True, checked by default.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
+        _warn_deprecated(self.__class__)
+        components.Checkbox.__init__(
+            self, value=default, label=label, optional=optional
         )
-        super().__init__(value=default, label=label, optional=optional)
 
 
 class CheckboxGroup(components.CheckboxGroup):
@@ -133,7 +159,7 @@ class CheckboxGroup(components.CheckboxGroup):
     def __init__(
         self,
         choices: List[str],
-        default: List[str] = [],
+        default: Optional[List[str]] = None,
         type: str = "value",
         label: Optional[str] = None,
         optional: bool = False,
@@ -141,15 +167,16 @@ class CheckboxGroup(components.CheckboxGroup):
         """
         Parameters:
         choices (List[str]): list of options to select from.
-        default (List[str]): default selected list of options.
+        default (List[str]): default selected list of options. If None, no option is selected by default.
         type (str): Type of value to be returned by component. "value" returns the list of strings of the choices selected, "index" returns the list of indicies of the choices selected.
         label (str): component name in interface.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        if default is None:
+            default = []
+        components.CheckboxGroup.__init__(
+            self,
             value=default,
             choices=choices,
             type=type,
@@ -180,10 +207,9 @@ class Radio(components.Radio):
         label (str): component name in interface.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Radio.__init__(
+            self,
             choices=choices,
             type=type,
             value=default,
@@ -214,10 +240,9 @@ class Dropdown(components.Dropdown):
         label (str): component name in interface.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Dropdown.__init__(
+            self,
             choices=choices,
             type=type,
             value=default,
@@ -254,10 +279,9 @@ class Image(components.Image):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no uploaded image, in which case the input value is None.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your component from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Image.__init__(
+            self,
             shape=shape,
             image_mode=image_mode,
             invert_colors=invert_colors,
@@ -290,10 +314,10 @@ class Video(components.Video):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no uploaded video, in which case the input value is None.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
+        _warn_deprecated(self.__class__)
+        components.Video.__init__(
+            self, format=type, source=source, label=label, optional=optional
         )
-        super().__init__(format=type, source=source, label=label, optional=optional)
 
 
 class Audio(components.Audio):
@@ -316,10 +340,10 @@ class Audio(components.Audio):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no uploaded audio, in which case the input value is None.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
+        _warn_deprecated(self.__class__)
+        components.Audio.__init__(
+            self, source=source, type=type, label=label, optional=optional
         )
-        super().__init__(source=source, type=type, label=label, optional=optional)
 
 
 class File(components.File):
@@ -344,10 +368,9 @@ class File(components.File):
         keep_filename (bool): DEPRECATED. Original filename always kept.
         optional (bool): If True, the interface can be submitted with no uploaded image, in which case the input value is None.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.File.__init__(
+            self,
             file_count=file_count,
             type=type,
             label=label,
@@ -386,10 +409,9 @@ class Dataframe(components.Dataframe):
         label (str): component name in interface.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
-        )
-        super().__init__(
+        _warn_deprecated(self.__class__)
+        components.Dataframe.__init__(
+            self,
             value=default,
             headers=headers,
             row_count=row_count,
@@ -422,10 +444,8 @@ class Timeseries(components.Timeseries):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no uploaded csv file, in which case the input value is None.
         """
-        warnings.warn(
-            "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
-        )
-        super().__init__(x=x, y=y, label=label, optional=optional)
+        _warn_deprecated(self.__class__)
+        components.Timeseries.__init__(self, x=x, y=y, label=label, optional=optional)
 
 
 class State(components.State):
@@ -445,10 +465,11 @@ class State(components.State):
         default (Any): the initial value of the state.
         optional (bool): this parameter is ignored.
         """
-        warnings.warn(
+        _warn_deprecated(
+            self.__class__,
             "Usage of gradio.inputs is deprecated, and will not be supported in the future, please import this component as gr.State() from gradio.components",
         )
-        super().__init__(value=default, label=label)
+        components.State.__init__(self, value=default, label=label)
 
 
 class Image3D(components.Model3D):
@@ -467,7 +488,8 @@ class Image3D(components.Model3D):
         label (str): component name in interface.
         optional (bool): If True, the interface can be submitted with no uploaded image, in which case the input value is None.
         """
-        warnings.warn(
+        _warn_deprecated(
+            self.__class__,
             "Usage of gradio.outputs is deprecated, and will not be supported in the future, please import your components from gradio.components",
         )
-        super().__init__(label=label, optional=optional)
+        components.Model3D.__init__(self, label=label, optional=optional)
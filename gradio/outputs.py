@@ -1,8 +1,8 @@
 # type: ignore
 """
-This module defines various classes that can serve as the `output` to an interface. Each class must inherit from
-`OutputComponent`, and each class must define a path to its template. All of the subclasses of `OutputComponent` are
-automatically added to a registry, which allows them to be easily referenced in other parts of the code.
+This module defines deprecated classes that can serve as the `output` to an interface. Each class is a thin subclass
+of the corresponding component in `gradio.components` that maps the legacy arguments onto the new ones. These
+classes are not registered anywhere: string shortcuts such as "textbox" are resolved against `gradio.components`.
 """
 
 from __future__ import annotations
@@ -10,6 +10,7 @@ import os
 import pathlib  # noqa: F401
 import shutil
 import tempfile
+import warnings
 from copy import deepcopy
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -40,7 +41,8 @@ class TestComponent:
         assert isinstance(gr.components.component("textarea"), gr.templates.TextArea)
 
 
-def test_raise_warnings():
+def test_raise_warnings(monkeypatch):
+    monkeypatch.setattr(gr.inputs, "_WARNING_REGISTRIES", {})
     for c_type, component in zip(
         ["inputs", "outputs"], [gr.inputs.Textbox, gr.outputs.Label]
     ):
@@ -48,6 +50,24 @@ def test_raise_warnings():
             component()
 
 
+def test_inputs_deprecation_warning_raised_once_per_class(monkeypatch):
+    monkeypatch.setattr(gr.inputs, "_WARNING_REGISTRIES", {})
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("default")
+        gr.inputs.Slider()
+        gr.inputs.Slider()
+    assert sum("Usage of gradio.inputs" in str(w.message) for w in record) == 1
+
+
+def test_inputs_deprecation_warning_not_lost_when_first_ignored(monkeypatch):
+    monkeypatch.setattr(gr.inputs, "_WARNING_REGISTRIES", {})
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        gr.inputs.Number()
+    with pytest.warns(UserWarning, match="Usage of gradio.inputs"):
+        gr.inputs.Number()
+
+
 class TestTextbox:
     def test_component_functions(self):
         """